@@ -63,13 +63,17 @@ class Info(Mapping[str, VT], Generic[VT]):
             **kwargs: Arbitrary keyword arguments.
 
         """
-        cls.__map__ = {}
-        cls.__map_reverse__ = {}
-
-        temp = ['__map__', '__map_reverse__', '__builtin__']
-        for obj in cls.mro():
-            temp.extend(dir(obj))
-        cls.__builtin__ = set(temp)
+        # NOTE: The name mappings and the builtin method names are computed
+        # only once per class, as data models are instantiated frequently,
+        # e.g., once per packet or fragment.
+        if '__builtin__' not in cls.__dict__:
+            cls.__map__ = {}
+            cls.__map_reverse__ = {}
+
+            temp = ['__map__', '__map_reverse__', '__builtin__']
+            for obj in cls.mro():
+                temp.extend(dir(obj))
+            cls.__builtin__ = set(temp)
 
         # NOTE: We only generate ``__init__`` method for subclasses of the
         # ``Info`` class, rather than itself, plus that such class does not
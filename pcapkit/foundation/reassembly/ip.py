@@ -20,7 +20,7 @@ from pcapkit.utilities.compat import Tuple
 
 if TYPE_CHECKING:
     from ipaddress import IPv4Address, IPv6Address
-    from typing import Optional, overload
+    from typing import Any, Optional, overload
 
     from typing_extensions import Literal
 
@@ -31,6 +31,13 @@ __all__ = ['IP_Reassembly']
 
 AT = TypeVar('AT', 'IPv4Address', 'IPv6Address')
 
+#: Null fragment received bit table for growing :attr:`Buffer.RCVBT`.
+_NULL_RCVBT = memoryview(bytes(16384))
+#: Full fragment received bit table for setting :attr:`Buffer.RCVBT` bits. The
+#: last fragment block of a datagram can be up to 16383, i.e., the maximum
+#: fragment offset (8191) plus the maximum fragment length (8192 blocks).
+_FULL_RCVBT = memoryview(b'\x01' * 16384)
+
 ###############################################################################
 # Data Models
 ###############################################################################
@@ -102,22 +109,47 @@ class Datagram(Info, Generic[AT]):
         def __init__(self, completed: 'bool', id: 'DatagramID[AT]', index: 'tuple[int, ...]', header: 'bytes', payload: 'bytes | tuple[bytes, ...]', packet: 'Optional[Protocol]') -> 'None': ...  # pylint: disable=unused-argument,super-init-not-called,multiple-statements,line-too-long,redefined-builtin
 
 
-class Buffer(Info, Generic[AT]):
-    """Data model for :term:`ipv4.buffer` / :term:`ipv6.buffer`."""
+class Buffer(Generic[AT]):
+    """Data model for :term:`ipv4.buffer` / :term:`ipv6.buffer`.
+
+    Note:
+        Unlike the other data models, :class:`Buffer` is *mutable* and does
+        not inherit from :class:`~pcapkit.corekit.infoclass.Info`, as it is
+        only used internally and updated in place for each fragment.
+
+    """
 
+    #: Original packet identifier.
+    id: 'DatagramID[AT]'
     #: Total data length.
     TDL: 'int'
+    #: Number of expected fragment blocks, i.e., ``(TDL + 7) // 8``; ``0``
+    #: if the total data length is not yet known.
+    expected: 'int'
+    #: Number of received fragment blocks.
+    received: 'int'
     #: Fragment received bit table.
     RCVBT: 'bytearray'
     #: List of reassembled packets.
     index: 'list[int]'
     #: Header buffer.
     header: 'bytes'
-    #: Data buffer, holes set to ``b'\x00'``.
-    datagram: 'bytearray'
+    #: Fragment buffer, mapping of fragment offset to fragment payload, in
+    #: order of arrival.
+    fragment: 'dict[int, bytearray]'
 
-    if TYPE_CHECKING:
-        def __init__(self, TDL: 'int', RCVBT: 'bytearray', index: 'list[int]', header: 'bytes', datagram: 'bytearray') -> 'None': ...  # pylint: disable=unused-argument,super-init-not-called,multiple-statements,line-too-long,redefined-builtin
+    __slots__ = ('id', 'TDL', 'expected', 'received', 'RCVBT', 'index', 'header', 'fragment')
+
+    def __init__(self, id: 'DatagramID[AT]', TDL: 'int', expected: 'int', received: 'int',  # pylint: disable=redefined-builtin
+                 RCVBT: 'bytearray', index: 'list[int]', header: 'bytes', fragment: 'dict[int, bytearray]') -> 'None':
+        self.id = id
+        self.TDL = TDL
+        self.expected = expected
+        self.received = received
+        self.RCVBT = RCVBT
+        self.index = index
+        self.header = header
+        self.fragment = fragment
 
 
 ###############################################################################
@@ -125,7 +157,7 @@ class Buffer(Info, Generic[AT]):
 ###############################################################################
 
 
-class IP_Reassembly(Reassembly[Packet[AT], Datagram[AT], Tuple[AT, AT, 'int', 'TransType'], Buffer[AT]], Generic[AT]):  # pylint: disable=abstract-method
+class IP_Reassembly(Reassembly[Packet[AT], Datagram[AT], Tuple['int', 'int', 'int', 'TransType'], Buffer[AT]], Generic[AT]):  # pylint: disable=abstract-method
     """Reassembly for IP payload.
 
     Important:
@@ -135,6 +167,14 @@ class IP_Reassembly(Reassembly[Packet[AT], Datagram[AT], Tuple[AT, AT, 'int', 'T
 
     """
 
+    ##########################################################################
+    # Defaults.
+    ##########################################################################
+
+    #: Maximum number of datagrams being reassembled at the same time. Should
+    #: the buffer be full, the oldest datagram will be flushed.
+    __buffer_size__: 'int' = 4096
+
     ##########################################################################
     # Methods.
     ##########################################################################
@@ -150,69 +190,148 @@ class IP_Reassembly(Reassembly[Packet[AT], Datagram[AT], Tuple[AT, AT, 'int', 'T
         self._newflg = False
         self.__cached__.clear()
 
+        self._process(info)
+
+    def run(self, packets: 'list[Packet[AT]]') -> 'None':
+        """Run automatically.
+
+        Arguments:
+            packets: list of packet dicts to be reassembled
+
+        Consecutive fragments of the same datagram are reassembled against
+        the buffer looked up for the first of them, and the cache is cleared
+        only once for the whole batch.
+
+        """
+        # clear cache
+        self._newflg = False
+        self.__cached__.clear()
+
+        key = None  # type: Optional[tuple[int, int, int, TransType]]
+        buf = None  # type: Optional[Buffer[AT]]
+        for info in packets:
+            key, buf = self._process(info, key, buf)
+
+    def _process(self, info: 'Packet[AT]', key: 'Optional[tuple[int, int, int, TransType]]' = None,
+                 buf: 'Optional[Buffer[AT]]' = None) -> 'tuple[tuple[int, int, int, TransType], Optional[Buffer[AT]]]':
+        """Reassemble one fragment.
+
+        Arguments:
+            info: info dict of packets to be reassembled
+            key: buffer key of the previous fragment
+            buf: buffer of the previous fragment
+
+        Returns:
+            Buffer key of the fragment and its buffer, if still in
+            :attr:`~pcapkit.foundation.reassembly.reassembly.Reassembly._buffer`.
+
+        Should the fragment share ``key`` with the previous fragment, ``buf``
+        will be used as its buffer without looking up again.
+
+        """
         BUFID = info.bufid  # Buffer Identifier
         FO = info.fo        # Fragment Offset
         IHL = info.ihl      # Internet Header Length
         MF = info.mf        # More Fragments flag
         TL = info.tl        # Total Length
+        DL = TL - IHL       # Data Length (header excludes)
+
+        # NOTE: The buffer is keyed by the integral form of the IP addresses,
+        # as hashing the IP address objects is rather expensive, whilst the
+        # buffer is looked up several times for each fragment. The IP
+        # addresses already store their integral form as the ``_ip``
+        # attribute, which saves a call to ``__int__`` for each of them. The
+        # payload protocol type is kept as-is, as it is not necessarily a
+        # :class:`~pcapkit.const.reg.transtype.TransType` member (e.g., the
+        # DPKT engine gives its name as :obj:`str`).
+        KEY = (BUFID[0]._ip, BUFID[1]._ip, BUFID[2], BUFID[3])  # pylint: disable=protected-access
+
+        if KEY != key:
+            buf = self._buffer.get(KEY)
 
         # when non-fragmented (possibly discarded) packet received
         if not FO and not MF:
-            if BUFID in self._buffer:
+            if buf is not None:
                 self._dtgram.extend(
-                    self.submit(self._buffer.pop(BUFID), bufid=BUFID)
+                    self.submit(self._buffer.pop(KEY))
                 )
-                return
+                return KEY, None
 
         # initialise buffer with BUFID
-        if BUFID not in self._buffer:
-            self._buffer[BUFID] = Buffer(
+        if buf is None:
+            # flush the oldest buffer should the buffer be full, in lieu of
+            # the reassembly timer as described in :rfc:`791`
+            if len(self._buffer) >= self.__buffer_size__:
+                oldest = self._buffer.pop(next(iter(self._buffer)))
+                if self._strflg:
+                    self._dtgram.extend(
+                        self.submit(oldest)
+                    )
+
+            buf = self._buffer[KEY] = Buffer(
+                id=DatagramID(                      # original packet identifier
+                    src=BUFID[0],
+                    dst=BUFID[1],
+                    id=BUFID[2],
+                    proto=BUFID[3],
+                ),
                 TDL=-1,                              # Total Data Length
-                RCVBT=bytearray(8191),              # Fragment Received Bit Table
+                expected=0,                         # number of expected fragment blocks
+                received=0,                         # number of received fragment blocks
+                RCVBT=bytearray(),                  # Fragment Received Bit Table
                 index=[],                           # index record
                 header=b'' if FO else info.header,  # header buffer
-                datagram=bytearray(65535),          # data buffer
+                fragment={},                        # fragment buffer
             )
         else:
             # put header into header buffer
-            if not FO:  # pylint: disable=else-if-used
-                self._buffer[BUFID].__update__(header=info.header)
+            if not FO:
+                buf.header = info.header
 
         # append packet index
-        self._buffer[BUFID].index.append(info.num)
-
-        # put data into data buffer
-        start = FO
-        stop = TL - IHL + FO
-        self._buffer[BUFID].datagram[start:stop] = info.payload
-
-        # set RCVBT bits (in 8 octets)
+        buf.index.append(info.num)
+
+        # put data into fragment buffer
+        # NOTE: The payload is only copied into a flat data buffer upon
+        # submission, so that the memory held by a buffer is proportional to
+        # the data actually received. Any fragment previously received at
+        # the same offset is removed first, so that the fragments are kept in
+        # order of arrival and later data overrides overlaps.
+        buf.fragment.pop(FO, None)
+        buf.fragment[FO] = info.payload
+
+        # set RCVBT bits (in 8 octets) & count newly received blocks
         start = FO // 8
-        stop = FO // 8 + (TL - IHL + 7) // 8
-        self._buffer[BUFID].RCVBT[start:stop] = b'\x01' * (stop - start + 1)
+        stop = max(start, start + (DL + 7) // 8)  # malformed if TL < IHL
+        if stop > len(buf.RCVBT):  # grow RCVBT on demand
+            buf.RCVBT += _NULL_RCVBT[:stop - len(buf.RCVBT)]
+        buf.received += stop - start - buf.RCVBT.count(1, start, stop)
+        buf.RCVBT[start:stop] = _FULL_RCVBT[start:stop]
 
         # get total data length (header excludes)
-        TDL = 0
         if not MF:
-            TDL = TL - IHL + FO
-            self._buffer[BUFID].__update__(TDL=TDL)
+            buf.TDL = DL + FO
+            buf.expected = (buf.TDL + 7) // 8
 
         # when datagram is reassembled in whole
-        start = 0
-        stop = (TDL + 7) // 8
-        if TDL and all(self._buffer[BUFID].RCVBT[start:stop]):
+        # NOTE: The received blocks counter is checked first, so that the
+        # RCVBT is scanned only once the datagram is likely to be completed.
+        stop = buf.expected
+        if stop and buf.received >= stop and buf.RCVBT.find(0, 0, stop) == -1:
             self._dtgram.extend(
-                self.submit(self._buffer.pop(BUFID), bufid=BUFID, checked=True)
+                self.submit(self._buffer.pop(KEY), checked=True)
             )
+            return KEY, None
+        return KEY, buf
 
-    def submit(self, buf: 'Buffer[AT]', *, bufid: 'tuple[AT, AT, int, TransType]',  # type: ignore[override] # pylint: disable=arguments-differ
-               checked: 'bool' = False) -> 'list[Datagram[AT]]':
+    def submit(self, buf: 'Buffer[AT]', *, checked: 'bool' = False,  # type: ignore[override] # pylint: disable=arguments-differ
+               **kwargs: 'Any') -> 'list[Datagram[AT]]':
         """Submit reassembled payload.
 
         Arguments:
             buf: buffer dict of reassembled packets
-            bufid: buffer identifier
             checked: buffer consistency checked flag
+            **kwargs: arbitrary keyword arguments
 
         Returns:
             Reassembled packets.
@@ -222,54 +341,50 @@ class IP_Reassembly(Reassembly[Packet[AT], Datagram[AT], Tuple[AT, AT, 'int', 'T
         RCVBT = buf.RCVBT
         index = buf.index
         header = buf.header
-        datagram = buf.datagram
 
-        start = 0
-        stop = (TDL + 7) // 8
-        flag = checked or (TDL and all(RCVBT[start:stop]))
+        # put data into data buffer, holes set to b'\x00'
+        datagram = bytearray(len(RCVBT) * 8)
+        for (offset, payload) in buf.fragment.items():
+            datagram[offset:offset + len(payload)] = payload
+
+        stop = buf.expected
+        flag = checked or (stop and buf.received >= stop and RCVBT.find(0, 0, stop) == -1)
         # if datagram is not implemented
-        if not flag and self._strflg:
+        if not flag:
+            # drop incomplete datagrams unless in strict mode
+            if not self._strflg:
+                return []
             data = []  # type: list[bytes]
-            byte = bytearray()
-            # extract received payload
-            for (bctr, bit) in enumerate(RCVBT):
-                if bit:     # received bit
-                    this = bctr * 8
-                    that = this + 8
-                    byte += datagram[this:that]
-                else:       # missing bit
-                    if byte:    # strip empty payload
-                        data.append(bytes(byte))
-                    byte = bytearray()
+            # extract received payload, i.e., each run of received bits
+            start = RCVBT.find(1)
+            while start != -1:
+                stop = RCVBT.find(0, start)
+                if stop == -1:
+                    stop = len(RCVBT)
+                data.append(bytes(datagram[start * 8:stop * 8]))
+                start = RCVBT.find(1, stop)
             # strip empty packets
-            if data or header:
-                packet = Datagram(
-                    completed=False,
-                    id=DatagramID(
-                        src=bufid[0],
-                        dst=bufid[1],
-                        id=bufid[2],
-                        proto=bufid[3],
-                    ),
-                    index=tuple(index),
-                    header=header,
-                    payload=tuple(data),
-                    packet=None,
-                )
+            if not (data or header):
+                return []
+            packet = Datagram(
+                completed=False,
+                id=buf.id,
+                index=tuple(index),
+                header=header,
+                payload=tuple(data),
+                packet=None,
+            )
         # if datagram is reassembled in whole
         else:
-            payload = datagram[:TDL]
+            # NOTE: The payload is copied out of the data buffer through a
+            # memoryview, so that it is copied exactly once.
+            payload = bytes(memoryview(datagram)[:TDL])
             packet = Datagram(
                 completed=True,
-                id=DatagramID(
-                    src=bufid[0],
-                    dst=bufid[1],
-                    id=bufid[2],
-                    proto=bufid[3],
-                ),
+                id=buf.id,
                 index=tuple(index),
                 header=header,
-                payload=bytes(payload),
-                packet=self.protocol.analyze(bufid[3], bytes(payload)),
+                payload=payload,
+                packet=self.protocol.analyze(buf.id.proto, payload),
             )
         return [packet]
@@ -27,7 +27,7 @@ DT = TypeVar('DT', bound='Info')
 # buffer ID
 IT = TypeVar('IT', bound='tuple')
 # buffer
-BT = TypeVar('BT', bound='Info')
+BT = TypeVar('BT')
 
 
 class Reassembly(Generic[PT, DT, IT, BT], metaclass=abc.ABCMeta):
@@ -131,6 +131,7 @@ def ipv4_reassembly(packet: 'Packet', *, count: 'int' = -1) -> 'IP_Packet[IPv4Ad
     if ipv4 is not None:
         if ipv4.df:     # dismiss not fragmented packet
             return None
+        hdr_len = ipv4.hl * 4  # in 32-bit words
 
         data = IP_Packet(
             bufid=(
@@ -142,12 +143,12 @@ def ipv4_reassembly(packet: 'Packet', *, count: 'int' = -1) -> 'IP_Packet[IPv4Ad
                 RegType_TransType.get(ipv4.p).name,             # payload protocol type
             ),
             num=count,                                          # original packet range number
-            fo=ipv4.off,                                        # fragment offset
-            ihl=ipv4.__hdr_len__,                               # internet header length
+            fo=(ipv4.off & 0x1fff) * 8,                         # fragment offset (in 8 octets), flags excluded
+            ihl=hdr_len,                                        # internet header length
             mf=bool(ipv4.mf),                                   # more fragment flag
             tl=ipv4.len,                                        # total length, header includes
-            header=ipv4.pack()[:ipv4.__hdr_len__],              # raw bytes type header
-            payload=bytearray(ipv4.pack()[ipv4.__hdr_len__:]),  # raw bytearray type payload
+            header=ipv4.pack()[:hdr_len],                       # raw bytes type header
+            payload=bytearray(ipv4.pack()[hdr_len:]),           # raw bytearray type payload
         )
         return data
     return None
@@ -136,8 +136,8 @@ def ipv4_reassembly(packet: 'Packet', *, count: 'int' = -1) -> 'IP_Packet[IPv4Ad
                 RegType_TransType.get(ipv4.proto),     # payload protocol type
             ),
             num=count,                                 # original packet range number
-            fo=ipv4.frag,                              # fragment offset
-            ihl=ipv4.ihl,                              # internet header length
+            fo=ipv4.frag * 8,                          # fragment offset (in 8 octets)
+            ihl=ipv4.ihl * 4,                          # internet header length (in 32-bit words)
             mf=bool(ipv4.flags.MF),                    # more fragment flag
             tl=ipv4.len,                               # total length, header includes
             header=ipv4.raw_packet_cache,              # raw bytes type header
@@ -55,9 +55,10 @@ def seekset(func: 'Callable[Concatenate[Protocol, P], R]') -> 'Callable[P, R]':
         # extract self object
         self = cast('Protocol', args[0])
 
-        # move file pointer
+        # move file pointer (if not already there)
         seek_cur = self._file.tell()
-        self._file.seek(self._seekset, os.SEEK_SET)
+        if seek_cur != self._seekset:
+            self._file.seek(self._seekset, os.SEEK_SET)
 
         # call method
         return_ = func(*args, **kw)
@@ -110,7 +111,6 @@ def beholder(func: 'Callable[Concatenate[Protocol, int, Optional[int], P], R]')
                 from pcapkit.protocols.misc.null import NoPayload as protocol  # isort: skip # pylint: disable=import-outside-toplevel
             else:
                 from pcapkit.protocols.misc.raw import Raw as protocol  # type: ignore[no-redef] # isort: skip # pylint: disable=import-outside-toplevel
-            # error = traceback.format_exc(limit=1).strip().rsplit(os.linesep, maxsplit=1)[-1]
 
             # log error
             #logger.error(str(exc), exc_info=exc, stack_info=DEVMODE, stacklevel=stacklevel())
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import ipaddress
+
+from pcapkit.const.reg.transtype import TransType
+from pcapkit.foundation.reassembly.ip import Packet
+from pcapkit.foundation.reassembly.ipv4 import IPv4_Reassembly
+
+
+def fragment(id, fo, payload, mf=True):  # pylint: disable=redefined-builtin
+    return Packet(
+        bufid=(ipaddress.ip_address('10.0.0.1'), ipaddress.ip_address('10.0.0.2'), id, TransType.UDP),
+        num=id, fo=fo, ihl=20, mf=mf, tl=20 + len(payload),
+        header=b'\x45' + b'\x00' * 19, payload=bytearray(payload),
+    )
+
+
+for strict in (True, False):
+    reassembly = IPv4_Reassembly(strict=strict)
+    reassembly.__buffer_size__ = 2
+
+    reassembly(fragment(1, 16, b''))             # empty buffer, evicted by 3
+    reassembly(fragment(2, 0, b'\x01' * 16))     # partial buffer, evicted by 4
+    reassembly(fragment(3, 0, b'\x02' * 16))
+    reassembly(fragment(4, 0, b'\x03' * 8))
+    assert len(reassembly._buffer) == 2  # pylint: disable=protected-access
+
+    for datagram in reassembly.datagram:
+        print(f'strict = {strict}, id = {datagram.id.id}, completed = {datagram.completed}, '
+              f'payload = {datagram.payload!r}')
+        assert not datagram.completed
+    assert sorted(datagram.id.id for datagram in reassembly.datagram) == ([2, 3, 4] if strict else [])